@@ -4,12 +4,24 @@ default settings. The ArgumentParser is the main object of the command line inte
 """
 
 import argparse
-import textwrap
+import functools
+
+_DESCRIPTION = """
+A simple Python program that retrieves weather data from different sources
+and displays the data on the console or on a display.
+"""
+
+_EPILOG = """
+Home page: <https://github.com/jlwolf94/weather_display/>
+Author: Jan-Lukas Wolf
+"""
 
 
+@functools.lru_cache(maxsize=1)
 def create_argument_parser():
     """
     Function that creates an ArgumentParser with default settings.
+    The ArgumentParser is created once and returned on all following calls.
 
     Returns:
         ArgumentParser: The ArgumentParser for the CLI with default settings.
@@ -21,18 +33,8 @@ def create_argument_parser():
 def _create_argument_parser_with_default_settings():
     return argparse.ArgumentParser(
         prog="weather_display",
-        description=textwrap.dedent(
-            """
-            A simple Python program that retrieves weather data from different sources
-            and displays the data on the console or on a display.
-            """
-        ),
-        epilog=textwrap.dedent(
-            """
-            Home page: <https://github.com/jlwolf94/weather_display/>
-            Author: Jan-Lukas Wolf
-            """
-        ),
+        description=_DESCRIPTION,
+        epilog=_EPILOG,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
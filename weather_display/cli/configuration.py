@@ -54,6 +54,9 @@ def load_config_from_json(data_directory):
         except OSError as err_os:
             print("I/O Error:", err_os)
             return {}
+        except json.JSONDecodeError as err_json:
+            print("JSON Error:", err_json)
+            return {}
     else:
         print("I/O Error: File stations.json does not exist.")
         return {}
@@ -6,7 +6,6 @@ and can only be accessed by one thread at a time.
 """
 
 import threading
-import time
 
 
 class Controller:
@@ -41,16 +40,29 @@ class Controller:
         int: Refresh time for data collection and display in minutes.
         """
 
-        self.is_exited = False
+        self._exit_event = threading.Event()
         """
-        bool: Exit status of the controller. The start value is false and
-            the status gets set to true when the exit method is called.
+        Event: Exit event of the controller. The event is not set at the start
+            and gets set when the exit method is called.
+        """
+
+        self._lock = threading.Lock()
+        """
+        Lock: The lock of a Controller class object.
+        """
+
+        self._shown_data = None
+        """
+        DisplayData, optional: The weather data that was shown last.
         """
 
-        self.rlock = threading.RLock()
+    @property
+    def is_exited(self):
         """
-        RLock: The reentrant lock of a Controller class object.
+        bool: Exit status of the controller. The start value is false and
+            the status gets set to true when the exit method is called.
         """
+        return self._exit_event.is_set()
 
     def activate_sleep(self, channel=0):
         """
@@ -61,7 +73,7 @@ class Controller:
             channel (int): The channel that is wired to the pressed button.
                 The default channel is zero.
         """
-        with self.rlock:
+        with self._lock:
             self.display.sleep(True)
 
     def update_and_show_data(self, channel=0):
@@ -74,10 +86,8 @@ class Controller:
             channel (int): The channel that is wired to the pressed button.
                 The default channel is zero.
         """
-        with self.rlock:
-            display_data = self.collector.get_display_data()
-            self.display.sleep(False)
-            self.display.show(display_data)
+        with self._lock:
+            self._update_and_show_data()
 
     def exit(self, channel=0):
         """
@@ -88,8 +98,7 @@ class Controller:
             channel (int): The channel that is wired to the pressed button.
                 The default channel is zero.
         """
-        with self.rlock:
-            self.is_exited = True
+        self._exit_event.set()
 
     def run(self):
         """
@@ -97,30 +106,31 @@ class Controller:
         that updates the data and display in the given refresh interval.
         This method is thread safe.
         """
-        with self.rlock:
-            self.update_and_show_data()
+        with self._lock:
+            self._update_and_show_data()
             self.display.add_event_detection(
                 [self.update_and_show_data, self.activate_sleep, self.exit]
             )
             refresh = self.refresh
 
-        while True:
-            for _ in range(60 * refresh):
-                time.sleep(1.0)
+        # Wait for the refresh interval and update and show data until the
+        # controller is exited.
+        while not self._exit_event.wait(timeout=60 * refresh):
+            with self._lock:
+                if not self.display.is_sleeping:
+                    self._update_and_show_data(force=False)
 
-                # Check every second whether the controller is exited.
-                with self.rlock:
-                    is_exited = self.is_exited
+        with self._lock:
+            self.display.remove_event_detection()
+            self.display.exit()
 
-                if is_exited:
-                    break
+    def _update_and_show_data(self, force=True):
+        display_data = self.collector.get_display_data()
 
-            # Update and show data or exit.
-            with self.rlock:
-                if self.is_exited:
-                    self.display.remove_event_detection()
-                    self.display.exit()
-                    return
+        # Skip the redraw of unchanged data if it is not forced.
+        if not force and display_data == self._shown_data:
+            return
+        self._shown_data = display_data
 
-                if not self.display.is_sleeping:
-                    self.update_and_show_data()
+        self.display.sleep(False)
+        self.display.show(display_data)
@@ -32,11 +32,12 @@ def create_collector(parser, args):
 def _create_collector_from_file_configuration(parser, args):
     data_directory = create_data_directory(args.dir)
     config = load_config_from_json(data_directory)
+    stations_dwd = StationsDWD(data_directory=data_directory)
     stations = {}
 
     for source, options in config.items():
         station_args = parser.parse_args(options)
-        station = _create_station_from_arguments(str(source), station_args, data_directory)
+        station = _create_station_from_arguments(str(source), station_args, stations_dwd)
         stations.update({str(source): station})
 
     return Collector(stations)
@@ -47,13 +48,13 @@ def _create_collector_from_arguments(args):
     return Collector({str(args.src): station})
 
 
-def _create_station_from_arguments(source, args, data_directory=None):
+def _create_station_from_arguments(source, args, stations_dwd=None):
     if source == Collector.SOURCES[1] or source == "1":
         station = _create_w24_station(args)
     elif source == Collector.SOURCES[2] or source == "2":
         station = _create_won_station(args)
     else:
-        station = _create_dwd_station(args, data_directory)
+        station = _create_dwd_station(args, stations_dwd)
 
     return station
 
@@ -78,9 +79,13 @@ def _create_won_station(args):
     return station
 
 
-def _create_dwd_station(args, data_directory):
-    stations_dwd = StationsDWD(data_directory=data_directory)
-    stations_dwd.update()
+def _create_dwd_station(args, stations_dwd=None):
+    if stations_dwd is None:
+        stations_dwd = StationsDWD()
+
+    # The stations table is only loaded once for all stations of a configuration.
+    if not stations_dwd.table_entries:
+        stations_dwd.update()
 
     if args.lat is not None and args.lon is not None:
         station = stations_dwd.get_station_by_distance(args.lat, args.lon)
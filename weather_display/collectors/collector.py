@@ -5,6 +5,8 @@ update data contained in the different data sources.
 """
 
 import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
 
 from weather_display.models.station import Station
 from weather_display.models.display_data import DisplayData
@@ -26,6 +28,13 @@ class Collector:
         A tuple containing the names of available data sources.
     """
 
+    _DEFAULT_DISPLAY_DATA = DisplayData()
+    """
+    _DEFAULT_DISPLAY_DATA (DisplayData):
+        A default DisplayData object used for comparisons. It is shared
+        between all calls and must not be modified.
+    """
+
     def __init__(self, stations):
         """
         Constructor for the Collector objects.
@@ -67,6 +76,15 @@ class Collector:
                 else:
                     self.data_sources.update({self.SOURCES[0]: DataDWD(station)})
 
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.data_sources), thread_name_prefix="collector"
+        )
+        """
+        _executor (ThreadPoolExecutor):
+            Thread pool with one worker per data source that is reused
+            for all concurrent updates of the data sources.
+        """
+
     @staticmethod
     def combine_display_data(dd_res, dd_new):
         """
@@ -88,8 +106,8 @@ class Collector:
             The updated result DisplayData object.
         """
 
-        # Get default DisplayData object for comparison.
-        dd_def = DisplayData()
+        # Get the shared default DisplayData object for comparison.
+        dd_def = Collector._DEFAULT_DISPLAY_DATA
 
         # Update station name if necessary.
         if (dd_new.station_name != dd_def.station_name):
@@ -122,6 +140,16 @@ class Collector:
 
         return dd_res
 
+    def close(self):
+        """
+        Method that shuts down the thread pool and closes the connections
+        of all data sources.
+        """
+
+        self._executor.shutdown()
+        for data in self.data_sources.values():
+            data.close()
+
     def get_display_data(self):
         """
         Method that gets the weather data that will be displayed from
@@ -140,14 +168,8 @@ class Collector:
             self.update()
 
         # Combine the weather data in a result DisplayData object.
-        dd_res = DisplayData()
-        is_first = True
-        for data in self.data_sources.values():
-            if is_first:
-                dd_res = data.get_display_data()
-                is_first = False
-            else:
-                dd_res = self.combine_display_data(dd_res, data.get_display_data())
+        dd_res = reduce(self.combine_display_data,
+                        (data.get_display_data() for data in self.data_sources.values()))
 
         # Reset the update status and return the result data.
         self.is_updated = False
@@ -156,13 +178,13 @@ class Collector:
     def update(self):
         """
         Method that updates the station_data of all data sources by calling
-        the associated update method of the sources. It also saves the combined
-        success status of the updates.
+        the associated update method of the sources. The sources are updated
+        concurrently, because every update waits for an independent request.
+        It also saves the combined success status of the updates.
         """
 
-        # Call all update methods and combine the success status.
-        is_updated = True
-        for data in self.data_sources.values():
-            is_updated = is_updated and data.update()
+        # Call all update methods concurrently and combine the success status.
+        futures = [self._executor.submit(data.update) for data in self.data_sources.values()]
+        is_updated = all([future.result() for future in futures])
 
         self.is_updated = is_updated
@@ -3,10 +3,17 @@ The data module contains the Data abstract base class that is used as
 a prototype with all common methods for the specialized data classes.
 """
 
+import logging
 import math
+import time
 from abc import ABC, abstractmethod
+from types import MappingProxyType
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+logger = logging.getLogger(__name__)
 
 
 class Data(ABC):
@@ -15,6 +22,17 @@ class Data(ABC):
     for the specialized data classes.
     """
 
+    BROWSER_HEADERS = MappingProxyType(
+        {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) "
+            + "Gecko/20100101 Firefox/114.0"
+        }
+    )
+    """
+    Mapping[str, str]: Read-only header parameters shared by all data sources
+        that request websites made for browsers.
+    """
+
     def __init__(self, station, attempts=3, timeout=10):
         """
         Constructor for the Data objects.
@@ -57,12 +75,41 @@ class Data(ABC):
         int: Connection timeout for a server answer in seconds.
         """
 
+        self.stream = False
+        """
+        bool: Indicates whether the response body is not read in advance and
+            is streamed by get_station_data instead.
+        """
+
         self.station_data = {}
         """
         dict: A dictionary containing all current weather data from the
             station specified by station.
         """
 
+        self.max_age = 60
+        """
+        int: Time in seconds after a successful update in which the station_data
+            is considered current and no new request is made.
+        """
+
+        self._update_time = None
+        """
+        float, optional: Monotonic time of the last successful update.
+        """
+
+        self._validators = {}
+        """
+        dict[str, str]: Conditional header parameters built from the ETag and
+            Last-Modified headers of the response of the last successful update.
+        """
+
+        self.session = self._create_session(attempts)
+        """
+        Session: Session used for all get requests. It keeps the connection to the
+            server alive between the updates and retries failed requests.
+        """
+
     @staticmethod
     def calc_dew_point(humidity, temperature):
         """
@@ -80,7 +127,7 @@ class Data(ABC):
             float: The calculated dew point in degree Celsius for the given
                 relative humidity and temperature.
         """
-        if humidity == float("nan") or temperature == float("nan"):
+        if math.isnan(humidity) or math.isnan(temperature) or humidity <= 0:
             return float("nan")
 
         # Define empirical constants for the equation.
@@ -94,37 +141,58 @@ class Data(ABC):
         # Calculate the result with the modified Magnus formula.
         f_one = k_two - (temperature / k_four)
         f_two = temperature / (k_three + temperature)
-        gamma_m = math.log((humidity / 100) * math.exp(f_one * f_two))
+        gamma_m = math.log(humidity / 100) + f_one * f_two
         return (k_three * gamma_m) / (k_two - gamma_m)
 
+    @staticmethod
+    def _create_session(attempts):
+        # A Retry-After header is ignored, because its unbounded wait would block
+        # the controller. The increasing backoff delay is used instead.
+        retry = Retry(
+            total=max(attempts - 1, 0),
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            respect_retry_after_header=False,
+        )
+        adapter = HTTPAdapter(max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def get_station_response(self):
         """
         Method that triggers a get request to the standard url with the set
-        parameters, headers and timeout. The method handles all possible
-        error cases.
+        parameters, headers and timeout. Failed connections and temporary server
+        errors are retried by the session with an increasing delay. The method
+        handles all possible error cases. If station_data is available, the request
+        is conditional and the server can answer with 304 Not Modified.
 
         Returns:
             Response, optional: The response object of the request to the
                 standard url with the set parameters and headers or None.
         """
-        for _ in range(self.attempts):
-            try:
-                response = requests.get(
-                    url=self.url, params=self.params, headers=self.headers, timeout=self.timeout
-                )
-                response.raise_for_status()
-            except requests.exceptions.HTTPError as err_http:
-                print("HTTP Error:", err_http)
-            except requests.exceptions.ConnectionError as err_con:
-                print("Connection Error:", err_con)
-            except requests.exceptions.Timeout as err_time:
-                print("Timeout Error:", err_time)
-            except requests.exceptions.TooManyRedirects as err_red:
-                print("Redirect Error:", err_red)
-            except requests.exceptions.RequestException as err_req:
-                print("Request Error:", err_req)
-            else:
-                return response
+        headers = self.headers
+        if self.station_data and self._validators:
+            headers = {**(self.headers or {}), **self._validators}
+
+        try:
+            response = self.session.get(
+                url=self.url,
+                params=self.params,
+                headers=headers,
+                timeout=self.timeout,
+                stream=self.stream,
+            )
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as err_http:
+            err_http.response.close()
+            logger.warning("HTTP Error: %s", err_http)
+        except requests.exceptions.RequestException as err_req:
+            logger.warning("Request Error: %s", err_req)
+        else:
+            return response
 
         return None
 
@@ -157,19 +225,51 @@ class Data(ABC):
         """
         pass
 
+    def close(self):
+        """
+        Method that closes the session and all its open connections.
+        """
+        self.session.close()
+
     def update(self):
         """
         Method that updates the station_data with data from the standard url
-        using the set parameters and headers. If the specified station is
-        not available then the current data is not overwritten.
+        using the set parameters and headers. If the station_data is younger
+        than max_age or the server reports it as not modified, no new data
+        is processed. If the specified station is not available then the
+        current data is not overwritten.
 
         Returns:
             bool: Indicates whether the update process was a success or not.
         """
-        station_data = self.get_station_data(self.get_station_response())
+        if self._update_time is not None and time.monotonic() - self._update_time < self.max_age:
+            return True
+
+        response = self.get_station_response()
+        if response is not None and response.status_code == requests.codes.not_modified:
+            response.close()
+            self._update_time = time.monotonic()
+            return True
+
+        validators = self._get_validators(response)
+        station_data = self.get_station_data(response)
 
         if station_data:
             self.station_data = station_data
+            self._validators = validators
+            self._update_time = time.monotonic()
             return True
         else:
             return False
+
+    @staticmethod
+    def _get_validators(response):
+        if response is None:
+            return {}
+
+        validators = {}
+        if "ETag" in response.headers:
+            validators["If-None-Match"] = response.headers["ETag"]
+        if "Last-Modified" in response.headers:
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+        return validators
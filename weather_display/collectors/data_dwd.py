@@ -4,12 +4,20 @@ to the DWD-API, save the received data and preprocess the received data for disp
 purposes.
 """
 
-from datetime import datetime, timedelta
-from functools import reduce
+import logging
+from datetime import datetime
+from operator import itemgetter
+
+import numpy as np
+import orjson
+import requests
+import urllib3
 
 from weather_display.collectors.data import Data
 from weather_display.models.display_data import DisplayData
 
+logger = logging.getLogger(__name__)
+
 
 class DataDWD(Data):
     """
@@ -45,6 +53,18 @@ class DataDWD(Data):
         dict[str, str], optional: Dictionary with all header parameters for the get request.
         """
 
+        self.stream = True
+        """
+        bool: Indicates whether the response body is not read in advance and
+            is streamed by get_station_data instead.
+        """
+
+        self._value_arrays = (None, None)
+        """
+        tuple[dict, tuple[ndarray, ndarray, ndarray, ndarray]]: The last processed
+            forecast dictionary and the value arrays created from it.
+        """
+
     def get_station_data(self, response):
         """
         Method that processes the response of a request to the standard url
@@ -58,11 +78,37 @@ class DataDWD(Data):
             dict: A dictionary containing all current weather data from the
                 station specified by station.
         """
-        if response is not None:
-            return response.json()
-        else:
+        if response is None:
             return {}
 
+        # Decode the streamed response body directly from the raw response.
+        with response:
+            content_type = response.headers.get("Content-Type", "")
+            if not content_type.startswith("application/json"):
+                logger.warning("Content Error: Unexpected content type %s.", content_type)
+                return {}
+
+            response.raw.decode_content = True
+            try:
+                json_data = orjson.loads(response.raw.read())
+            except (urllib3.exceptions.HTTPError, requests.exceptions.RequestException) as err_req:
+                logger.warning("Request Error: %s", err_req)
+                return {}
+            except orjson.JSONDecodeError as err_json:
+                logger.warning("JSON Error: %s", err_json)
+                return {}
+
+        # Keep only the parts of the station data that are used for display.
+        station_dict = json_data.get(self.station.identifier, {})
+        if not station_dict:
+            return {}
+
+        return {
+            self.station.identifier: {
+                key: station_dict[key] for key in ("forecast1", "days") if key in station_dict
+            }
+        }
+
     def get_display_data(self):
         """
         Method that extracts the weather data that will be displayed from
@@ -75,90 +121,88 @@ class DataDWD(Data):
         """
         display_data = DisplayData(station_name=self.station.name)
 
-        forecast_dict = self.station_data.get(self.station.identifier, {}).get("forecast1", {})
-        display_data = self._update_display_data_with_forecast_dict(display_data, forecast_dict)
+        # Check whether data for the station is available.
+        station_dict = self.station_data.get(self.station.identifier)
+        if not station_dict:
+            return display_data
 
-        days_list = self.station_data.get(self.station.identifier, {}).get("days", [])
-        display_data = self._update_display_data_with_days_list(display_data, days_list)
+        curr_date = datetime.now()
+
+        forecast_dict = station_dict.get("forecast1", {})
+        if forecast_dict:
+            display_data = self._update_display_data_with_value_arrays(
+                display_data, self._get_value_arrays(forecast_dict), curr_date
+            )
+
+        days_list = station_dict.get("days", [])
+        display_data = self._update_display_data_with_days_list(display_data, days_list, curr_date)
 
         return display_data
 
-    def _update_display_data_with_forecast_dict(self, display_data, forecast_dict):
-        if forecast_dict:
-            date_start = datetime.fromtimestamp(forecast_dict["start"] / 1000)
-            date_step = timedelta(milliseconds=forecast_dict["timeStep"])
-            date_start_step = (date_start, date_step)
+    def _get_value_arrays(self, forecast_dict):
+        # Convert the forecast values only once for the same station_data.
+        if self._value_arrays[0] is not forecast_dict:
+            self._value_arrays = (forecast_dict, self._create_value_arrays(forecast_dict))
+        return self._value_arrays[1]
 
-            date_temp_list = self._create_date_value_list(
-                forecast_dict["temperature"], date_start_step, (-999, 999), float("nan")
-            )
-            date_dew_list = self._create_date_value_list(
-                forecast_dict["dewPoint2m"], date_start_step, (-999, 999), float("nan")
-            )
-            date_pre_list = self._create_date_value_list(
-                forecast_dict["precipitationTotal"], date_start_step, (0, 999), 0.0
-            )
+    @staticmethod
+    def _create_value_arrays(forecast_dict):
+        temps = DataDWD._convert_forecast_values(
+            forecast_dict["temperature"], (-999, 999), float("nan")
+        )
+        dews = DataDWD._convert_forecast_values(
+            forecast_dict["dewPoint2m"], (-999, 999), float("nan")
+        )
+        pres = DataDWD._convert_forecast_values(forecast_dict["precipitationTotal"], (0, 999), 0.0)
 
-            return self._update_display_data_with_value_lists(
-                display_data, date_temp_list, date_dew_list, date_pre_list
-            )
+        # Forecast dates as timestamps in milliseconds.
+        dates = forecast_dict["start"] + forecast_dict["timeStep"] * np.arange(len(temps))
+
+        return dates, temps, dews, pres
+
+    @staticmethod
+    def _update_display_data_with_days_list(display_data, days_list, curr_date):
+        day = DataDWD._get_day_closest_to_current_date(days_list, curr_date)
+        if day is not None:
+            return DataDWD._update_display_data_with_day(display_data, day)
         else:
             return display_data
 
-    def _update_display_data_with_days_list(self, display_data, days_list):
-        if days_list:
-            day = self._get_day_closest_to_current_date(days_list)
-            return self._update_display_data_with_day(display_data, day)
-        else:
+    @staticmethod
+    def _update_display_data_with_value_arrays(display_data, value_arrays, curr_date):
+        dates, temps, dews, pres = value_arrays
+        index = DataDWD._get_index_closest_to_current_date(dates, curr_date)
+        if index < 0:
             return display_data
 
-    def _update_display_data_with_value_lists(
-        self, display_data, date_temp_list, date_dew_list, date_pre_list
-    ):
-        date_temp = self._get_date_temp_closest_to_current_date(date_temp_list)
-        display_data.date_time = date_temp[0]
-        display_data.temperature = date_temp[1]
+        display_data.date_time = datetime.fromtimestamp(dates[index] / 1000)
+        display_data.temperature = float(temps[index])
 
-        # Use the found date_time to find the dew point.
-        display_data.dew_point = next(
-            (dd[1] for dd in date_dew_list if dd[0] == date_temp[0]), float("nan")
-        )
+        # Use the found index to find the dew point.
+        display_data.dew_point = float(dews[index]) if index < len(dews) else float("nan")
 
         # Add up all precipitation data per hour to get the precipitation per day.
-        display_data.precipitation = reduce(
-            lambda x, y: x + y, [dp[1] for dp in date_pre_list if dp[0] <= date_temp[0]], 0.0
-        )
+        display_data.precipitation = float(np.sum(pres[: index + 1]))
 
         return display_data
 
     @staticmethod
-    def _create_date_value_list(forecast_dict_value, date_start_step, limits, default_value):
-        date_start, date_step = date_start_step
+    def _convert_forecast_values(forecast_dict_value, limits, default_value):
         lower_limit, upper_limit = limits
-        date_value_list = []
-        for step, value in enumerate(forecast_dict_value):
-            if value < lower_limit or value > upper_limit:
-                date_value_list.append((date_start + (step * date_step), default_value))
-            else:
-                date_value_list.append((date_start + (step * date_step), value / 10))
-        return date_value_list
+        values = np.asarray(forecast_dict_value, dtype=np.float64)
+        is_valid = (values >= lower_limit) & (values <= upper_limit)
+        return np.where(is_valid, values / 10, default_value)
 
     @staticmethod
-    def _get_date_temp_closest_to_current_date(date_temp_list):
-        curr_date = datetime.now()
-        date_temp = min(
-            [dt for dt in date_temp_list if dt[0] <= curr_date], key=lambda t: abs(curr_date - t[0])
-        )
-        return date_temp
+    def _get_index_closest_to_current_date(dates, curr_date):
+        curr_timestamp = curr_date.timestamp() * 1000
+        return int(np.searchsorted(dates, curr_timestamp, side="right")) - 1
 
     @staticmethod
-    def _get_day_closest_to_current_date(days_list):
-        curr_date = datetime.now()
-        day = min(
-            [da for da in days_list if datetime.strptime(da["dayDate"], "%Y-%m-%d") <= curr_date],
-            key=lambda d: abs(curr_date - datetime.strptime(d["dayDate"], "%Y-%m-%d")),
-        )
-        return day
+    def _get_day_closest_to_current_date(days_list, curr_date):
+        dated_days = ((datetime.fromisoformat(da["dayDate"]), da) for da in days_list)
+        past_days = [dd for dd in dated_days if dd[0] <= curr_date]
+        return max(past_days, key=itemgetter(0))[1] if past_days else None
 
     @staticmethod
     def _update_display_data_with_day(display_data, day):
@@ -3,14 +3,18 @@ The data_w24 module contains the DataW24 class that is used to download and pars
 the wetter24 website, save the data and preprocess the extracted data for display purposes.
 """
 
-import json
+import logging
+import re
 from datetime import datetime
 
-from bs4 import BeautifulSoup
+import numpy as np
+import orjson
 
 from weather_display.collectors.data import Data
 from weather_display.models.display_data import DisplayData
 
+logger = logging.getLogger(__name__)
+
 
 class DataW24(Data):
     """
@@ -18,6 +22,11 @@ class DataW24(Data):
     used for the website requests. It stores the received data for later use or display.
     """
 
+    INIT_PATTERN = re.compile(rb"initWeatherStation\((\{.*?\})\)", re.DOTALL)
+    """
+    re.Pattern: Pattern used to extract the weather data from the website content.
+    """
+
     def __init__(self, station, attempts=3, timeout=10):
         """
         Constructor for the DataW24 objects.
@@ -31,13 +40,7 @@ class DataW24(Data):
         """
         super().__init__(station, attempts, timeout)
 
-        self.url = (
-            "http://www.wetter24.de/wetterstation"
-            + "/"
-            + station.name.lower()
-            + "/"
-            + str(station.number)
-        )
+        self.url = f"http://www.wetter24.de/wetterstation/{station.name.lower()}/{station.number}"
         """
         str: Standard url for the get requests.
         """
@@ -47,13 +50,9 @@ class DataW24(Data):
         dict[str, str], optional: Dictionary with all parameters for the get request.
         """
 
-        user_agent = (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) " + "Gecko/20100101 Firefox/114.0"
-        )
-
-        self.headers = {"User-Agent": user_agent}
+        self.headers = self.BROWSER_HEADERS
         """
-        dict[str, str]: Dictionary with all header parameters for the get request.
+        Mapping[str, str]: Read-only mapping with all header parameters for the get request.
         """
 
     def get_station_data(self, response):
@@ -72,18 +71,17 @@ class DataW24(Data):
         if response is None:
             return {}
 
-        page = BeautifulSoup(response.content, features="lxml")
-
-        # Extract all script tags of main.
-        scripts = page.find("main").find_all("script", recursive=False)
-
-        # If there are no two script tags, then an error occurred.
-        if len(scripts) != 2:
+        # The call of initWeatherStation in a script tag contains all weather data
+        # of the station, so the website does not need to be parsed as a whole.
+        match = self.INIT_PATTERN.search(response.content)
+        if match is None:
             return {}
 
-        # The script tag content contains all weather data of the station.
-        data_string = scripts[0].get_text().split("initWeatherStation(")[1].split(")")[0]
-        return json.loads(data_string)
+        try:
+            return orjson.loads(match.group(1))
+        except orjson.JSONDecodeError as err_json:
+            logger.warning("JSON Error: %s", err_json)
+            return {}
 
     def get_display_data(self):
         """
@@ -107,12 +105,11 @@ class DataW24(Data):
 
     def _update_display_data_with_temp_dict(self, display_data, temp_dict):
         if temp_dict:
-            temp_list = temp_dict.get("measuredTemperature", [])
-            display_data = self._update_display_data_date_time_and_temp(display_data, temp_list)
-            display_data = self._update_display_data_daily_min_and_max(display_data, temp_list)
+            temps = self._create_value_array(temp_dict.get("measuredTemperature", []))
+            display_data = self._update_display_data_with_temps(display_data, temps)
 
-            dew_point_list = temp_dict.get("dewpoints", [])
-            display_data = self._update_display_data_dew_point(display_data, dew_point_list)
+            dew_points = self._create_value_array(temp_dict.get("dewpoints", []))
+            display_data = self._update_display_data_dew_point(display_data, dew_points)
 
             return display_data
         else:
@@ -131,46 +128,42 @@ class DataW24(Data):
             return display_data
 
     @staticmethod
-    def _update_display_data_date_time_and_temp(display_data, temp_list):
-        for temp in reversed(temp_list):
-            if temp[1] is not None:
-                display_data.date_time = datetime.fromtimestamp(temp[0] / 1000)
-                display_data.temperature = float(temp[1])
-                break
-        return display_data
+    def _create_value_array(value_list):
+        # Missing values are converted to NaN.
+        values = np.array([(value[0], value[1]) for value in value_list], dtype=np.float64)
+        return values.reshape(-1, 2)
 
-    def _update_display_data_daily_min_and_max(self, display_data, temp_list):
-        if display_data.date_time is not None:
-            curr_date = display_data.date_time.replace(hour=0, minute=0)
-            daily_min, daily_max = self._get_daily_min_and_max(curr_date, temp_list)
-            if daily_min != float("inf"):
-                display_data.daily_min = daily_min
-            if daily_max != float("-inf"):
-                display_data.daily_max = daily_max
-            return display_data
-        else:
-            return display_data
+    @staticmethod
+    def _get_last_valid_index(values):
+        valid_indices = np.flatnonzero(~np.isnan(values[:, 1]))
+        return valid_indices[-1] if valid_indices.size else -1
 
     @staticmethod
-    def _get_daily_min_and_max(curr_date, temp_list):
-        daily_min = float("inf")
-        daily_max = float("-inf")
-        for temp in reversed(temp_list):
-            if temp[1] is not None:
-                if datetime.fromtimestamp(temp[0] / 1000) < curr_date:
-                    break
-                else:
-                    curr_temp = float(temp[1])
-                    if curr_temp < daily_min:
-                        daily_min = curr_temp
-                    if curr_temp > daily_max:
-                        daily_max = curr_temp
-        return daily_min, daily_max
+    def _update_display_data_with_temps(display_data, temps):
+        # Skip all missing measurements once for all values.
+        temps = temps[~np.isnan(temps[:, 1])]
+        if not temps.size:
+            return display_data
+
+        display_data.date_time = datetime.fromtimestamp(temps[-1, 0] / 1000)
+        display_data.temperature = float(temps[-1, 1])
+
+        # Only use the measurements after the last measurement before the current day.
+        curr_date = display_data.date_time.replace(hour=0, minute=0)
+        curr_timestamp = curr_date.timestamp() * 1000
+        prev_indices = np.flatnonzero(temps[:, 0] < curr_timestamp)
+        start = prev_indices[-1] + 1 if prev_indices.size else 0
+        daily_temps = temps[start:, 1]
+
+        if daily_temps.size:
+            display_data.daily_min = float(daily_temps.min())
+            display_data.daily_max = float(daily_temps.max())
+
+        return display_data
 
     @staticmethod
-    def _update_display_data_dew_point(display_data, dew_point_list):
-        for dew_point in reversed(dew_point_list):
-            if dew_point[1] is not None:
-                display_data.dew_point = float(dew_point[1])
-                break
+    def _update_display_data_dew_point(display_data, dew_points):
+        index = DataW24._get_last_valid_index(dew_points)
+        if index >= 0:
+            display_data.dew_point = float(dew_points[index, 1])
         return display_data
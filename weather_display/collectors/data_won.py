@@ -4,10 +4,13 @@ the wetteronline website, save the data and preprocess the extracted data for
 display purposes.
 """
 
+import math
 from datetime import datetime, date
-from functools import reduce
+from functools import lru_cache
 
-from bs4 import BeautifulSoup
+import numpy as np
+from lxml import etree
+from lxml import html as lxml_html
 
 from weather_display.collectors.data import Data
 from weather_display.models.display_data import DisplayData
@@ -19,14 +22,48 @@ class DataWon(Data):
     used for the website requests. It stores the received data for later use or display.
     """
 
-    DATE_TIME_FORMAT_STRING = "%d.%m.%Y %H:%M"
+    NO_VALUE_MESSAGE = "keine Meldung"
     """
-    str: Format used to convert date time strings to datetime objects.
+    str: Message string when no value is present.
     """
 
-    NO_VALUE_MESSAGE = "keine Meldung"
+    NO_VALUE_STRINGS = frozenset(("", "-", NO_VALUE_MESSAGE))
     """
-    str: Message string when no value is present.
+    frozenset[str]: All strings that indicate that no value is present.
+    """
+
+    NO_VALUE_DATE_TIME = datetime(1970, 1, 1)
+    """
+    datetime: Date time used when no date time value is present.
+    """
+
+    TABLE_IDS = ("temperature", "humidity", "precipitation")
+    """
+    tuple[str, str, str]: Ids of the divs containing the temperature, humidity
+        and precipitation tables.
+    """
+
+    TABLE_DTYPE = np.dtype([("date_time", "datetime64[s]"), ("value", np.float64)])
+    """
+    dtype: Structured data type of the table arrays with a date time and a value column.
+    """
+
+    TABLE_ROWS_PATH = etree.XPath(
+        "div[@id=$table_id]"
+        + "/table[contains(concat(' ', normalize-space(@class), ' '), ' hourly ')]"
+        + "/tbody/tr"
+    )
+    """
+    XPath: Compiled path to all rows of the table in the div with the given id.
+    """
+
+    HTML_PARSER = lxml_html.HTMLParser(
+        encoding="utf-8", remove_blank_text=True, remove_comments=True, remove_pis=True
+    )
+    """
+    HTMLParser: Parser for the UTF-8 encoded wetteronline website. The fixed encoding
+        skips the encoding detection of the raw response content. Blank text,
+        comments and processing instructions are not added to the tree.
     """
 
     def __init__(self, station, attempts=3, timeout=10):
@@ -42,7 +79,7 @@ class DataWon(Data):
         """
         super().__init__(station, attempts, timeout)
 
-        self.url = "https://www.wetteronline.de/wetter-aktuell" + "/" + station.name.lower()
+        self.url = f"https://www.wetteronline.de/wetter-aktuell/{station.name.lower()}"
         """
         str: Standard url for the get requests.
         """
@@ -52,13 +89,9 @@ class DataWon(Data):
         dict[str, str]: Dictionary with all parameters for the get request.
         """
 
-        user_agent = (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) " + "Gecko/20100101 Firefox/114.0"
-        )
-
-        self.headers = {"User-Agent": user_agent}
+        self.headers = self.BROWSER_HEADERS
         """
-        dict[str, str]: Dictionary with all header parameters for the get request.
+        Mapping[str, str]: Read-only mapping with all header parameters for the get request.
         """
 
     def get_station_data(self, response):
@@ -77,23 +110,27 @@ class DataWon(Data):
         if response is None:
             return {}
 
-        page = BeautifulSoup(response.content, features="lxml")
+        page = lxml_html.document_fromstring(response.content, parser=self.HTML_PARSER)
 
         # Extract the div with all tables and check whether it exists.
-        table_div = page.find("div", id="showcase")
+        table_div = page.get_element_by_id("showcase", None)
         if table_div is None:
             return {}
 
-        tables = self._extract_tables(table_div)
-        row_data_list = self._extract_row_data_list(tables)
-        temperature_data = self._extract_temperature_data(row_data_list)
-        humidity_data = self._extract_humidity_data(row_data_list)
-        precipitation_data = self._extract_precipitation_data(row_data_list)
+        row_data_list = self._extract_row_data_list(table_div)
+        date_times = self._convert_date_time_strings(row_data_list)
+        temp_rows, humi_rows, prec_rows = row_data_list
 
         return {
-            "temperatures": temperature_data,
-            "humidities": humidity_data,
-            "precipitations": precipitation_data,
+            "temperatures": self._create_table_array(
+                temp_rows, date_times, self._convert_temperature_string
+            ),
+            "humidities": self._create_table_array(
+                humi_rows, date_times, self._convert_humidity_string
+            ),
+            "precipitations": self._create_table_array(
+                prec_rows, date_times, self._convert_precipitation_string
+            ),
         }
 
     def get_display_data(self):
@@ -109,128 +146,107 @@ class DataWon(Data):
         display_data = DisplayData(station_name=self.station.name)
 
         # Check whether temperature data is available.
-        temp_list = self.station_data.get("temperatures", [])
-        if temp_list:
+        temps = self.station_data.get("temperatures", ())
+        if len(temps):
             # Extract the current temperature with its date and time.
-            display_data.date_time = temp_list[0][0]
-            display_data.temperature = temp_list[0][1]
+            display_data.date_time = temps["date_time"][0].item()
+            display_data.temperature = float(temps["value"][0])
 
             # Search for min and max temperature of the day.
             if display_data.date_time is not None:
                 curr_date = display_data.date_time.replace(hour=0, minute=0)
-                daily_min = float("inf")
-                daily_max = float("-inf")
-                for temp in temp_list:
-                    if temp[0] < curr_date:
-                        break
-                    else:
-                        curr_temp = temp[1]
-                        if curr_temp < daily_min:
-                            daily_min = curr_temp
-                        if curr_temp > daily_max:
-                            daily_max = curr_temp
-
-                if daily_min != float("inf"):
-                    display_data.daily_min = daily_min
-                if daily_max != float("-inf"):
-                    display_data.daily_max = daily_max
+                daily_temps = self._get_daily_temps(curr_date, temps)
+                if daily_temps.size:
+                    display_data.daily_min = float(daily_temps.min())
+                    display_data.daily_max = float(daily_temps.max())
 
         # Check whether humidity data is available.
-        humi_list = self.station_data.get("humidities", [])
-        if humi_list:
+        humis = self.station_data.get("humidities", ())
+        if len(humis):
             # Calculate the current dew point.
             display_data.dew_point = self.calc_dew_point(
-                humidity=humi_list[0][1], temperature=display_data.temperature
+                humidity=float(humis["value"][0]), temperature=display_data.temperature
             )
 
         # Check whether precipitation data is available.
-        prec_list = self.station_data.get("precipitations", [])
-        if prec_list:
-            # Extract the precipitation per day.
-            display_data.precipitation = reduce(
-                lambda x, y: x + y, [prec[1] for prec in prec_list if prec[0].minute == 0], 0.0
-            )
+        precs = self.station_data.get("precipitations", ())
+        if len(precs):
+            # Extract the precipitation per day from the values at full hours.
+            minutes = precs["date_time"].astype("datetime64[m]").astype(np.int64) % 60
+            display_data.precipitation = math.fsum(precs["value"][minutes == 0])
 
         return display_data
 
     @staticmethod
-    def _extract_tables(table_div):
+    def _extract_row_data_list(table_div):
         return [
-            table_div.find("div", id="temperature", recursive=False),
-            table_div.find("div", id="humidity", recursive=False),
-            table_div.find("div", id="precipitation", recursive=False),
+            [
+                [td.text_content() for td in row.findall("td")]
+                for row in DataWon.TABLE_ROWS_PATH(table_div, table_id=table_id)
+            ]
+            for table_id in DataWon.TABLE_IDS
         ]
 
     @staticmethod
-    def _extract_row_data_list(tables):
-        rows_list = [
-            (
-                table.find("table", attrs={"class": "hourly"}, recursive=False)
-                .find("tbody", recursive=False)
-                .find_all("tr", recursive=False)
-            )
-            for table in tables
-        ]
-        return [
-            [[td.get_text() for td in row.find_all("td", recursive=False)] for row in rows]
-            for rows in rows_list
-        ]
-
-    def _extract_temperature_data(self, row_data_list):
-        return [
-            [self._convert_date_time_string(data[0]), self._convert_temperature_string(data[1])]
-            for data in row_data_list[0]
-        ]
+    def _convert_date_time_strings(row_data_list):
+        # All tables share the same dates, so every date is converted only once.
+        date_time_strings = {data[0] for row_data in row_data_list for data in row_data}
+        year = date.today().year
+        return {dts: DataWon._convert_date_time_string(dts, year) for dts in date_time_strings}
 
-    def _extract_humidity_data(self, row_data_list):
-        return [
-            [self._convert_date_time_string(data[0]), self._convert_humidity_string(data[1])]
-            for data in row_data_list[1]
-        ]
+    @staticmethod
+    def _create_table_array(row_data, date_times, convert_value):
+        return np.array(
+            [(date_times[data[0]], convert_value(data[1])) for data in row_data],
+            dtype=DataWon.TABLE_DTYPE,
+        )
 
-    def _extract_precipitation_data(self, row_data_list):
-        return [
-            [self._convert_date_time_string(data[0]), self._convert_precipitation_string(data[1])]
-            for data in row_data_list[2]
-        ]
+    @staticmethod
+    def _get_daily_temps(curr_date, temps):
+        # The table starts with the latest measurement, so the current day
+        # ends with the first earlier measurement.
+        prev_indices = np.flatnonzero(temps["date_time"] < np.datetime64(curr_date))
+        end = prev_indices[0] if prev_indices.size else len(temps)
+        daily_temps = temps["value"][:end]
+        return daily_temps[~np.isnan(daily_temps)]
 
     @staticmethod
-    def _convert_date_time_string(date_time):
-        if date_time == "" or date_time == "-" or date_time == DataWon.NO_VALUE_MESSAGE:
-            return datetime.strptime("01.01.1970 00:00", DataWon.DATE_TIME_FORMAT_STRING)
+    @lru_cache(maxsize=512)
+    def _convert_date_time_string(date_time, year):
+        if date_time in DataWon.NO_VALUE_STRINGS:
+            return DataWon.NO_VALUE_DATE_TIME
         else:
+            # The date is given as DD.MM. and the time as HH:MM without the year.
             dt_list = date_time.split(" ")
-            return datetime.strptime(
-                dt_list[1] + str(date.today().year) + " " + dt_list[2],
-                DataWon.DATE_TIME_FORMAT_STRING,
-            )
+            day, month, _ = dt_list[1].split(".")
+            hour, minute = dt_list[2].split(":")
+            return datetime(year, int(month), int(day), int(hour), int(minute))
 
     @staticmethod
     def _convert_temperature_string(temperature):
-        # Split the unit from the number.
-        number_string = temperature.split("°")[0]
-        if number_string == "" or number_string == "-" or number_string == DataWon.NO_VALUE_MESSAGE:
-            return float("nan")
-        else:
+        # Split the unit from the number. Strings without a number are no values.
+        number_string, _, _ = temperature.partition("°")
+        try:
             return float(number_string)
+        except ValueError:
+            return float("nan")
 
     @staticmethod
     def _convert_humidity_string(humidity):
-        # Split the unit from the number.
-        number_string = humidity.split("%")[0]
-        if number_string == "" or number_string == "-" or number_string == DataWon.NO_VALUE_MESSAGE:
-            return float("nan")
-        else:
+        # Split the unit from the number. Strings without a number are no values.
+        number_string, _, _ = humidity.partition("%")
+        try:
             return float(number_string)
+        except ValueError:
+            return float("nan")
 
     @staticmethod
     def _convert_precipitation_string(precipitation):
-        if precipitation == "" or precipitation == "-" or precipitation == DataWon.NO_VALUE_MESSAGE:
+        # Split the unit and check whether there is a sign for the number.
+        number_string, _, _ = precipitation.partition(" ")
+        if number_string and not number_string[0].isdigit():
+            number_string = number_string[1:]
+        try:
+            return float(number_string)
+        except ValueError:
             return 0.0
-        else:
-            # Split the unit and check whether there is a sign for the number.
-            number_string = precipitation.split(" ")[0]
-            if number_string[0].isdigit():
-                return float(number_string)
-            else:
-                return float(number_string[1:])
@@ -4,15 +4,22 @@ all stations listed on the corresponding DWD website and to convert the table
 to a processable json file. The class handles all needed request and I/O processes.
 """
 
+import logging
 import math
 import json
+import os
+import random
+import time
 import requests
 
 from datetime import datetime, timedelta
+from email.utils import formatdate
 from pathlib import Path
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from weather_display.models.station import Station
 
+logger = logging.getLogger(__name__)
+
 
 class StationsDWD:
     """
@@ -100,7 +107,21 @@ class StationsDWD:
             The path to the config and data directory.
         """
 
-        self.table_entries = {}
+        self._table_entries = {}
+        """
+        _table_entries (dict[str, dict[str, str]]):
+            A dictionary containing all stations from the stations table.
+        """
+
+        self._folded_names = {}
+        """
+        _folded_names (dict[str, str]):
+            A dictionary that maps the case folded station names
+            to the station names in the stations table.
+        """
+
+    @property
+    def table_entries(self):
         """
         table_entries (dict[str, dict[str, str]]):
             A dictionary containing all stations from the stations table.
@@ -108,12 +129,25 @@ class StationsDWD:
             corresponding values are dictionaries filled with the
             additional station informations.
         """
+        return self._table_entries
+
+    @table_entries.setter
+    def table_entries(self, table_entries):
+        # Index the names once, so that a search ignoring the case is a lookup.
+        self._table_entries = table_entries
+        self._folded_names = {name.casefold(): name for name in table_entries}
 
-    def get_table_response(self):
+    def get_table_response(self, modified_since=None):
         """
         Method that triggers a get request to the standard url with the set
         parameters, headers and timeout. The method handles all possible
-        error cases.
+        error cases. If a modification date is given, the request is
+        conditional and the server can answer with 304 Not Modified.
+
+        Parameters
+        ----------
+        modified_since (Optional[datetime]):
+            The date of the locally saved table. Default value is None.
 
         Returns
         -------
@@ -122,22 +156,31 @@ class StationsDWD:
             set parameters and headers or None.
         """
 
+        # Only request the table if it was modified since the given date.
+        headers = self.headers
+        if modified_since is not None:
+            headers = dict(self.headers)
+            headers["If-Modified-Since"] = formatdate(modified_since.timestamp(), usegmt=True)
+
         # Try to reach the server multiple times and handle occuring exceptions.
         for i in range(self.attempts):
+            # Wait increasingly longer with a random jitter before every new attempt.
+            if i > 0:
+                time.sleep(min(2.0, 0.5 * 2 ** (i - 1)) + random.uniform(0.0, 0.1))
+
             try:
                 response = requests.get(url=self.url, params=self.params,
-                                        headers=self.headers, timeout=self.timeout)
+                                        headers=headers, timeout=self.timeout)
                 response.raise_for_status()
             except requests.exceptions.HTTPError as err_http:
-                print("HTTP Error:", err_http)
-            except requests.exceptions.ConnectionError as err_con:
-                print("Connection Error:", err_con)
-            except requests.exceptions.Timeout as err_time:
-                print("Timeout Error:", err_time)
-            except requests.exceptions.TooManyRedirects as err_red:
-                print("Redirect Error:", err_red)
+                logger.warning("HTTP Error: %s", err_http)
+
+                # Client errors will not change with another attempt.
+                status_code = err_http.response.status_code
+                if status_code < 500 and status_code != requests.codes.too_many_requests:
+                    break
             except requests.exceptions.RequestException as err_req:
-                print("Request Error:", err_req)
+                logger.warning("Request Error: %s", err_req)
             else:
                 return response
 
@@ -165,8 +208,9 @@ class StationsDWD:
         if response is None:
             return {}
 
-        # Convert the response content to a searchable object.
-        stations_page = BeautifulSoup(response.content, features="lxml")
+        # Convert only the table of the response content to a searchable object.
+        stations_page = BeautifulSoup(response.content, features="lxml",
+                                      parse_only=SoupStrainer("table"))
 
         # Extract the table rows from the table in the stations page.
         table_rows = stations_page.find("table").find_all("tr", recursive=False)
@@ -194,7 +238,8 @@ class StationsDWD:
         """
         Method that searches a station identified by its name in the
         saved stations table and returns the informations of the station
-        in form of a Station object.
+        in form of a Station object. If the name is not found directly,
+        the name is compared ignoring the case.
 
         Parameters
         ----------
@@ -210,17 +255,12 @@ class StationsDWD:
         # Try to get the informations for the searched station.
         info = self.table_entries.get(station_name, {})
         if info:
-            return Station(station_name,
-                           number=int(info["Stations_ID"]),
-                           type=info["Kennung"],
-                           identifier=info["Stationskennung"],
-                           latitude=float(info["Breite"]),
-                           longitude=float(info["Länge"]),
-                           altitude=int(info["Stationshöhe"]),
-                           river_basin=info["Flussgebiet"],
-                           state=info["Bundesland"],
-                           start=datetime.strptime(info["Beginn"], "%d.%m.%Y"),
-                           end=datetime.strptime(info["Ende"], "%d.%m.%Y"))
+            return self._create_station(station_name, info)
+
+        # Fall back to a search that ignores the case of the name.
+        table_name = self._folded_names.get(station_name.casefold())
+        if table_name is not None:
+            return self._create_station(table_name, self.table_entries[table_name])
         else:
             return Station(station_name)
 
@@ -250,33 +290,29 @@ class StationsDWD:
         # Check whether data for a search is available.
         if self.table_entries:
             # Search for the closest station.
-            min_distance = float("inf")
-            min_name = "Error"
-            min_info = {}
-            for stn, sti in self.table_entries.items():
-                curr_distance = \
-                    math.dist(coordinates,
-                              (float(sti["Breite"]), float(sti["Länge"])))
-
-                if curr_distance < min_distance:
-                    min_distance = curr_distance
-                    min_name = stn
-                    min_info = sti
-
-            return Station(min_name,
-                           number=int(min_info["Stations_ID"]),
-                           type=min_info["Kennung"],
-                           identifier=min_info["Stationskennung"],
-                           latitude=float(min_info["Breite"]),
-                           longitude=float(min_info["Länge"]),
-                           altitude=int(min_info["Stationshöhe"]),
-                           river_basin=min_info["Flussgebiet"],
-                           state=min_info["Bundesland"],
-                           start=datetime.strptime(min_info["Beginn"], "%d.%m.%Y"),
-                           end=datetime.strptime(min_info["Ende"], "%d.%m.%Y"))
+            min_name, min_info = min(
+                self.table_entries.items(),
+                key=lambda entry: math.dist(
+                    coordinates, (float(entry[1]["Breite"]), float(entry[1]["Länge"]))))
+
+            return self._create_station(min_name, min_info)
         else:
             return Station("Error")
 
+    @staticmethod
+    def _create_station(station_name, info):
+        return Station(station_name,
+                       number=int(info["Stations_ID"]),
+                       type=info["Kennung"],
+                       identifier=info["Stationskennung"],
+                       latitude=float(info["Breite"]),
+                       longitude=float(info["Länge"]),
+                       altitude=int(info["Stationshöhe"]),
+                       river_basin=info["Flussgebiet"],
+                       state=info["Bundesland"],
+                       start=datetime.strptime(info["Beginn"], "%d.%m.%Y"),
+                       end=datetime.strptime(info["Ende"], "%d.%m.%Y"))
+
     def save_table_as_json(self, table_entries):
         """
         Method that saves the given table entries to a json file
@@ -302,12 +338,15 @@ class StationsDWD:
             data_directory.mkdir(parents=False, exist_ok=True)
             file_path = data_directory.joinpath(self.file_name)
 
-        # Write all table entries to the json file.
+        # Write all table entries to a temporary file and replace the json file
+        # afterwards, so that an interrupted write never leaves a broken cache.
+        tmp_file_path = file_path.with_name(file_path.name + ".tmp")
         try:
-            with file_path.open(mode="w", encoding="utf-8") as file:
-                json.dump(table_entries, file, ensure_ascii=False, indent=4)
+            with tmp_file_path.open(mode="w", encoding="utf-8") as file:
+                json.dump(table_entries, file, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_file_path, file_path)
         except OSError as err_os:
-            print("I/O Error:", err_os)
+            logger.warning("I/O Error: %s", err_os)
             return False
 
         return True
@@ -338,10 +377,13 @@ class StationsDWD:
                 with file_path.open(encoding="utf-8") as file:
                     return json.load(file)
             except OSError as err_os:
-                print("I/O Error:", err_os)
+                logger.warning("I/O Error: %s", err_os)
+                return {}
+            except json.JSONDecodeError as err_json:
+                logger.warning("JSON Error: %s", err_json)
                 return {}
         else:
-            print(f"I/O Error: File {self.file_name} does not exist.")
+            logger.warning("I/O Error: File %s does not exist.", self.file_name)
             return {}
 
     def update(self):
@@ -377,8 +419,25 @@ class StationsDWD:
                     self.table_entries = table_entries
                     return True
 
+            # Check whether the table changed since the last download.
+            response = self.get_table_response(mod_date)
+            if (response is not None
+                    and response.status_code == requests.codes.not_modified):
+                table_entries = self.load_table_from_json()
+
+                # Restart the refresh time of the unchanged json file.
+                if table_entries:
+                    self.table_entries = table_entries
+                    try:
+                        file_path.touch()
+                    except OSError as err_os:
+                        logger.warning("I/O Error: %s", err_os)
+                    return True
+
+                response = self.get_table_response()
+
             # An Update to the table entries and the json file is necessary.
-            table_entries = self.get_table_entries(self.get_table_response())
+            table_entries = self.get_table_entries(response)
             if table_entries:
                 self.table_entries = table_entries
                 return self.save_table_as_json(table_entries)
@@ -5,6 +5,8 @@ of the Display class. Additionally, it stores mapping dictionaries to convert
 data to strings that are human-readable.
 """
 
+import math
+
 
 class DisplayData:
     """
@@ -14,6 +16,17 @@ class DisplayData:
     dictionary is stored as well.
     """
 
+    __slots__ = (
+        "station_name",
+        "date_time",
+        "temperature",
+        "forecast",
+        "daily_min",
+        "daily_max",
+        "dew_point",
+        "precipitation",
+    )
+
     DATE_FORMAT = ("%a., %d.%m.%Y", "Thu., 01.01.1970")
     """
     tuple[str, str]: A tuple defining the date format and default output string for the format.
@@ -172,3 +185,30 @@ class DisplayData:
             str: A formatted string representing the weather forecast of the day.
         """
         return self.ICON_DICT.get(self.forecast, "Error")
+
+    def __eq__(self, other):
+        """
+        Method that compares the weather data of two DisplayData objects.
+        Missing values that are NAN in both objects are treated as equal.
+
+        Args:
+            other (object): The object that is compared with this DisplayData object.
+
+        Returns:
+            bool: True if all weather data of both objects is equal, otherwise False.
+        """
+        if not isinstance(other, DisplayData):
+            return NotImplemented
+
+        return all(
+            self._is_equal_value(getattr(self, name), getattr(other, name))
+            for name in self.__slots__
+        )
+
+    @staticmethod
+    def _is_equal_value(value, other_value):
+        # NAN never compares equal, so two NAN values are checked separately.
+        if isinstance(value, float) and isinstance(other_value, float):
+            return value == other_value or (math.isnan(value) and math.isnan(other_value))
+        else:
+            return value == other_value
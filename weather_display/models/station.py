@@ -9,6 +9,20 @@ class Station:
     Class that contains all information of a weather station.
     """
 
+    __slots__ = (
+        "name",
+        "number",
+        "type",
+        "identifier",
+        "latitude",
+        "longitude",
+        "altitude",
+        "river_basin",
+        "state",
+        "start",
+        "end",
+    )
+
     def __init__(
         self,
         name="Error",
@@ -25,9 +25,11 @@ def main():
         return 1
 
     collector = create_collector(parser, args)
-    display = create_display(args)
-
-    start_display(display, collector)
+    try:
+        display = create_display(args)
+        start_display(display, collector)
+    finally:
+        collector.close()
 
     return 0
 